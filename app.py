@@ -1,15 +1,41 @@
 import os
+import time
+from functools import lru_cache
 import dash
 from dash import dcc, html, Input, Output, State
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import yfinance as yf
 from dash.dash_table import DataTable
-from scipy.optimize import root_scalar
+from dash.exceptions import PreventUpdate
+from flask_caching import Cache
+
+# Seconds a fetched asset price is reused before Yahoo Finance is queried again
+PRICE_CACHE_TTL = 60
+
+# Assets available in the dropdown
+ASSET_OPTIONS = [
+    {"label": "Bitcoin (BTC)", "value": "BTC-USD"},
+    {"label": "Solana (SOL)", "value": "SOL-USD"},
+    {"label": "Tesla (TSLA)", "value": "TSLA"},
+    {"label": "MicroStrategy (MSTR)", "value": "MSTR"},
+    {"label": "Custom Asset", "value": "CUSTOM"}
+]
+
+# Default asset value for each preset asset
+DEFAULT_ASSET_VALUES = {
+    "BTC-USD": 623197,
+    "SOL-USD": 1360,
+    "TSLA": 4803,
+    "MSTR": 9299
+}
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
 
+# Cache for computed dashboard results, keyed on the form inputs
+cache = Cache(app.server, config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
+
 # Layout of the dashboard
 app.layout = html.Div([
     html.Div([
@@ -21,13 +47,7 @@ app.layout = html.Div([
             html.Label("Select Asset"),
             dcc.Dropdown(
                 id="input_asset_dropdown",
-                options=[
-                    {"label": "Bitcoin (BTC)", "value": "BTC-USD"},
-                    {"label": "Solana (SOL)", "value": "SOL-USD"},
-                    {"label": "Tesla (TSLA)", "value": "TSLA"},
-                    {"label": "MicroStrategy (MSTR)", "value": "MSTR"},
-                    {"label": "Custom Asset", "value": "CUSTOM"}
-                ],
+                options=ASSET_OPTIONS,
                 value="BTC-USD",
                 style={"marginBottom": "10px"}
             ),
@@ -64,42 +84,124 @@ app.layout = html.Div([
 # Function to fetch the current price of the asset using Yahoo Finance
 def fetch_asset_price(asset):
     try:
-        ticker = yf.Ticker(asset)
-        price = ticker.history(period="1d").iloc[-1]['Close']
-        return price
+        # Reuse the same price for every update within the current TTL window
+        return _fetch_asset_price(asset, int(time.time() // PRICE_CACHE_TTL))
     except Exception as e:
         print(f"Error fetching asset price: {e}")
         return None
 
+# Failed lookups raise instead of returning, so lru_cache only keeps successful prices
+@lru_cache(maxsize=128)
+def _fetch_asset_price(asset, time_bucket):
+    ticker = yf.Ticker(asset)
+    price = ticker.history(period="1d").iloc[-1]['Close']
+    return price
+
+# Function to build the per-year factors 1, (1 + rate), (1 + rate)**2, ... by running multiplication
+def compound_factors(rate, n_years):
+    return np.concatenate(([1.0], np.cumprod(np.full(n_years - 1, 1 + rate))))
+
+# Functions to calculate the required number of assets, skipping growth in year 1
+def skip_growth_factors(E0, V, infl, grow):
+    # Growth is skipped in year 1, so year k's expense compounds for n_years - k years
+    asset_factor = V * grow[-1]
+    expenses_fv = (E0 * infl * grow[::-1]).sum()
+    return asset_factor, expenses_fv
+
+def find_required_assets_with_skip_growth(E0, V, infl, grow):
+    # The final balance A * asset_factor - expenses_fv is linear in A, so solve it directly
+    asset_factor, expenses_fv = skip_growth_factors(E0, V, infl, grow)
+    if asset_factor == 0:
+        raise ValueError("Final balance does not depend on the number of assets.")
+    A_required = expenses_fv / asset_factor
+    if A_required <= 0:
+        raise ValueError("Required number of assets is not positive.")
+    return A_required
+
+# Function to compute the required assets and year-by-year table, memoized per set of inputs
+@cache.memoize()
+def _compute_projection(years, inflation, appreciation, asset_value, monthly_spend, start_year):
+    # Convert rates to decimals
+    inflation_rate = inflation / 100
+    appreciation_rate = appreciation / 100
+
+    # Calculate annual expenses from monthly spend
+    E0 = monthly_spend * 12
+
+    # Per-year inflation and growth factors, shared by the solve and the table
+    infl = compound_factors(inflation_rate, years)
+    grow = compound_factors(appreciation_rate, years)
+
+    A_required = find_required_assets_with_skip_growth(E0, asset_value, infl, grow)
+
+    # Generate the table data using the asset value (input_value)
+    years_idx = np.arange(1, years + 1)
+    expenses = E0 * infl
+    ending = grow * (A_required * asset_value - np.cumsum(expenses / grow))
+    starting = np.concatenate(([A_required * asset_value], ending[:-1]))
+    asset_growth = starting * appreciation_rate
+    asset_growth[0] = 0  # Skip growth in year 1
+    subtotal = starting + asset_growth
+
+    year_labels = (start_year + years_idx - 1).tolist()
+    starting = starting.round().tolist()
+    ending = ending.round().tolist()
+    data = [
+        {
+            "Year": year,
+            "Starting Balance (BAL)": start,
+            "Appreciation Rate": f"{appreciation}%%",
+            "Appreciation Value (Apprec)": growth,
+            "Subtotal": sub,
+            "Living Expenses": expense,
+            "Ending Balance": end
+        }
+        for year, start, growth, sub, expense, end in zip(
+            year_labels, starting, asset_growth.round().tolist(), subtotal.round().tolist(),
+            expenses.round().tolist(), ending)
+    ]
+
+    # Append totals row
+    data.append({
+        "Year": "Total",
+        "Starting Balance (BAL)": "-",
+        "Appreciation Rate": "-",
+        "Appreciation Value (Apprec)": round(asset_growth.sum(), 0),
+        "Subtotal": "-",
+        "Living Expenses": round(expenses.sum(), 0),
+        "Ending Balance": "-"
+    })
+
+    return A_required, data, year_labels, starting, ending
+
 # Callback to dynamically set the default value of the asset
 @app.callback(
     Output("input_value", "value"),
     [Input("input_asset_dropdown", "value")]
 )
 def set_default_asset_value(asset):
-    default_values = {
-        "BTC-USD": 623197,
-        "SOL-USD": 1360,
-        "TSLA": 4803,
-        "MSTR": 9299
-    }
-    return default_values.get(asset, 0)
+    return DEFAULT_ASSET_VALUES.get(asset, 0)
 
 # Callback to update the dashboard
 @app.callback(
     [Output("summary_section", "children"),
      Output("table_section", "children"),
      Output("graph_section", "figure")],
-    [Input("input_asset_dropdown", "value"),
-     Input("input_custom_asset", "value"),
-     Input("input_years", "value"),
-     Input("input_inflation", "value"),
-     Input("input_appreciation", "value"),
-     Input("input_value", "value"),
-     Input("input_monthly_spend", "value"),
-     Input("input_start_year", "value")]
+    [Input("update_button", "n_clicks")],
+    [State("input_asset_dropdown", "value"),
+     State("input_custom_asset", "value"),
+     State("input_years", "value"),
+     State("input_inflation", "value"),
+     State("input_appreciation", "value"),
+     State("input_value", "value"),
+     State("input_monthly_spend", "value"),
+     State("input_start_year", "value")]
 )
-def update_dashboard(asset, custom_asset, years, inflation, appreciation, asset_value, monthly_spend, start_year):
+def update_dashboard(n_clicks, asset, custom_asset, years, inflation, appreciation, asset_value, monthly_spend, start_year):
+    # Only recompute when the update button is clicked
+    if not n_clicks:
+        raise PreventUpdate
+
     # Determine the asset ticker
     asset_ticker = custom_asset if asset == "CUSTOM" else asset
 
@@ -108,45 +210,8 @@ def update_dashboard(asset, custom_asset, years, inflation, appreciation, asset_
     if current_price is None:
         current_price = 623197  # Default BTC price or fallback
 
-    # Convert rates to decimals
-    inflation_rate = inflation / 100
-    appreciation_rate = appreciation / 100
-
-    # Calculate annual expenses from monthly spend
-    E0 = monthly_spend * 12
-
-    # Calculate the required number of assets
-    def calculate_balance_with_skip_growth(A, n_years, E0, i, r, V):
-        initial_balance = A * V
-        balance = initial_balance
-        for year in range(1, n_years + 1):
-            expenses = E0 * (1 + i)**(year - 1)
-            if year == 1:
-                asset_growth = 0  # Skip growth in year 1
-            else:
-                asset_growth = balance * r
-            balance = balance + asset_growth - expenses
-        return balance
-
-    def find_required_assets_with_skip_growth(n_years, E0, i, r, V):
-        def balance_to_zero(A):
-            return calculate_balance_with_skip_growth(A, n_years, E0, i, r, V)
-        
-        # Dynamically expand or shrink the bracket
-        a, b = 0.01, 100
-        fa, fb = balance_to_zero(a), balance_to_zero(b)
-        while fa * fb > 0:
-            a /= 2
-            b *= 2
-            fa, fb = balance_to_zero(a), balance_to_zero(b)
-            if abs(a) < 1e-8 or abs(b) > 1e8:
-                raise ValueError("Could not find a valid bracket containing the root.")
-        
-        solution = root_scalar(balance_to_zero, bracket=[a, b], method='brentq')
-        return solution.root
-
     try:
-        A_required = find_required_assets_with_skip_growth(years, E0, inflation_rate, appreciation_rate, asset_value)
+        A_required, data, year_labels, starting, ending = _compute_projection(years, inflation, appreciation, asset_value, monthly_spend, start_year)
     except ValueError:
         return (html.Div([
                     html.H3(f"Asset Type: {asset_ticker}"),
@@ -155,61 +220,24 @@ def update_dashboard(asset, custom_asset, years, inflation, appreciation, asset_
 
     total_cost = A_required * current_price  # Total cost uses the current price
 
-    # Generate the table data using the asset value (input_value)
-    balance = A_required * asset_value
-    data = []
-    total_expenses = 0
-    total_appreciation = 0
-
-    for year in range(1, years + 1):
-        expenses = E0 * (1 + inflation_rate)**(year - 1)
-        if year == 1:
-            asset_growth = 0  # Skip growth in year 1
-        else:
-            asset_growth = balance * appreciation_rate
-        subtotal = balance + asset_growth
-        ending_balance = subtotal - expenses
-        data.append({
-            "Year": start_year + year - 1,
-            "Starting Balance (BAL)": round(balance, 0),
-            "Appreciation Rate": f"{appreciation}%%",
-            "Appreciation Value (Apprec)": round(asset_growth, 0),
-            "Subtotal": round(subtotal, 0),
-            "Living Expenses": round(expenses, 0),
-            "Ending Balance": round(ending_balance, 0)
-        })
-        balance = ending_balance
-        total_expenses += expenses
-        total_appreciation += asset_growth
-
-    # Append totals row
-    data.append({
-        "Year": "Total",
-        "Starting Balance (BAL)": "-",
-        "Appreciation Rate": "-",
-        "Appreciation Value (Apprec)": round(total_appreciation, 0),
-        "Subtotal": "-",
-        "Living Expenses": round(total_expenses, 0),
-        "Ending Balance": "-"
-    })
-
-    df = pd.DataFrame(data)
-
     # Create the table
     table = DataTable(
-        columns=[{"name": col, "id": col} for col in df.columns],
-        data=df.to_dict("records"),
+        columns=[{"name": col, "id": col} for col in data[0].keys()],
+        data=data,
         style_table={"overflowX": "auto"},
         style_cell={"textAlign": "left", "padding": "10px"},
         style_header={"backgroundColor": "#2c3e50", "color": "white", "fontWeight": "bold"}
     )
 
     # Create the graph
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(x=df[df["Year"] != "Total"]["Year"], y=df[df["Year"] != "Total"]["Starting Balance (BAL)"], mode="lines+markers", name="Starting Balance"))
-    fig.add_trace(go.Scatter(x=df[df["Year"] != "Total"]["Year"], y=df[df["Year"] != "Total"]["Ending Balance"], mode="lines+markers", name="Ending Balance"))
-    fig.update_layout(title="Financial Progression", xaxis_title="Year", yaxis_title="Balance ($)",
-                      template="plotly_white")
+    fig = go.Figure(
+        data=[
+            go.Scatter(x=year_labels, y=starting, mode="lines+markers", name="Starting Balance"),
+            go.Scatter(x=year_labels, y=ending, mode="lines+markers", name="Ending Balance")
+        ],
+        layout=go.Layout(title="Financial Progression", xaxis_title="Year", yaxis_title="Balance ($)",
+                         template="plotly_white")
+    )
 
     # Create the summary section
     summary = html.Div([